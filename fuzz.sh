@@ -0,0 +1 @@
+python3 src/fuzz.py
\ No newline at end of file
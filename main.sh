@@ -1 +1 @@
-python3 src/main.py
\ No newline at end of file
+exec python3 src/main.py "$@"
\ No newline at end of file
@@ -0,0 +1,75 @@
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+PAGE_COUNT = 1000
+RUNS = 5
+# Budgets for one cold CLI run against an already built site.
+IMPORT_BUDGET_MS = 30
+WALL_BUDGET_MS = 200
+
+MAIN_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "main.py")
+
+
+def make_site(root, page_count=PAGE_COUNT):
+    public_dir = os.path.join(root, "public")
+    os.makedirs(public_dir)
+    with open(os.path.join(public_dir, "styles.css"), "w") as f:
+        f.write("body { margin: 0 auto; }\n")
+    for i in range(page_count):
+        with open(os.path.join(public_dir, f"page_{i}.html"), "w") as f:
+            f.write(f"<html><body><h1>Page {i}</h1><p>Hello.</p></body></html>\n")
+
+
+def parse_importtime(stderr):
+    # Each line is "import time: self | cumulative | name"; top-level imports
+    # are the ones whose name is not indented, and their cumulative times add
+    # up to the total spent importing.
+    total_us = 0
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        if not cumulative_us.strip().isdigit():
+            continue
+        if not name.startswith("  "):
+            total_us += int(cumulative_us)
+    return total_us / 1000
+
+
+def run_once(site_dir):
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", MAIN_PATH],
+        cwd=site_dir,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    wall_ms = (time.perf_counter() - start) * 1000
+    return parse_importtime(result.stderr), wall_ms
+
+
+def bench(page_count=PAGE_COUNT, runs=RUNS):
+    with tempfile.TemporaryDirectory() as site_dir:
+        make_site(site_dir, page_count)
+        # The first run precompresses every page; what we budget is the
+        # steady state that watch mode and pre-commit hooks hit.
+        run_once(site_dir)
+        samples = [run_once(site_dir) for _ in range(runs)]
+    return min(s[0] for s in samples), min(s[1] for s in samples)
+
+
+def main():
+    import_ms, wall_ms = bench()
+    print(f"pages: {PAGE_COUNT}")
+    print(f"import time: {import_ms:.1f} ms (budget {IMPORT_BUDGET_MS} ms)")
+    print(f"wall time:   {wall_ms:.1f} ms (budget {WALL_BUDGET_MS} ms)")
+    if import_ms > IMPORT_BUDGET_MS or wall_ms > WALL_BUDGET_MS:
+        print("Startup is over budget.")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+import os
+import stat
+
+COMPRESSIBLE_EXTENSIONS = (".html", ".css")
+COMPRESSION_LEVEL = 9
+
+
+def is_stale(path, compressed_path):
+    if not os.path.exists(compressed_path):
+        return True
+    return os.path.getmtime(compressed_path) < os.path.getmtime(path)
+
+
+def precompress_file(path):
+    compressed_path = f"{path}.gz"
+    if not is_stale(path, compressed_path):
+        return None
+
+    import gzip
+
+    with open(path, "rb") as f:
+        data = f.read()
+
+    # mtime=0 keeps the output byte-for-byte reproducible between builds.
+    compressed = gzip.compress(data, compresslevel=COMPRESSION_LEVEL, mtime=0)
+
+    import tempfile
+
+    # A unique temp file per writer, so concurrent builds of the same page
+    # (the daemon and a plain main.py run, say) never publish each other's
+    # half-written output.
+    fd, tmp_path = tempfile.mkstemp(
+        prefix=f".{os.path.basename(compressed_path)}.",
+        suffix=".tmp",
+        dir=os.path.dirname(compressed_path),
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(compressed)
+        # mkstemp creates the file owner-only; give the .gz the source's
+        # permissions so it is exactly as readable as the page it mirrors.
+        os.chmod(tmp_path, stat.S_IMODE(os.stat(path).st_mode))
+        os.replace(tmp_path, compressed_path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+    return compressed_path
+
+
+def find_compressible_files(directory):
+    paths = []
+    for root, _dirs, files in os.walk(directory):
+        for name in sorted(files):
+            if name.endswith(COMPRESSIBLE_EXTENSIONS):
+                paths.append(os.path.join(root, name))
+    return paths
+
+
+def precompress_directory(directory, max_workers=None):
+    # Check staleness up front so an up-to-date site never pays for starting
+    # a process pool.
+    paths = [path for path in find_compressible_files(directory) if is_stale(path, f"{path}.gz")]
+    if not paths:
+        return []
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(precompress_file, paths)
+        return [path for path in results if path is not None]
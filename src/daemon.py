@@ -0,0 +1,179 @@
+import json
+import os
+import socket
+import socketserver
+import threading
+
+DEFAULT_SOCKET_PATH = ".render.sock"
+DEFAULT_PUBLIC_DIR = "public"
+
+
+def warm_worker():
+    # Runs once per worker process. compress imports gzip and tempfile only
+    # when it first writes a file, so load them here rather than on the first
+    # page each worker builds.
+    import gzip
+    import tempfile
+    import compress
+
+
+def build_page(path, public_dir=DEFAULT_PUBLIC_DIR):
+    from compress import COMPRESSIBLE_EXTENSIONS
+    from compress import precompress_file
+
+    # Paths can come from any client of the socket, so only ever write .gz
+    # files for site pages, never next to arbitrary files such as keys.
+    if not path.endswith(COMPRESSIBLE_EXTENSIONS):
+        return {"path": path, "status": "error", "error": f"not a {'/'.join(COMPRESSIBLE_EXTENSIONS)} file"}
+    public_root = os.path.realpath(public_dir)
+    if os.path.commonpath([public_root, os.path.realpath(path)]) != public_root:
+        return {"path": path, "status": "error", "error": f"outside {public_dir}"}
+
+    try:
+        compressed_path = precompress_file(path)
+    except OSError as e:
+        return {"path": path, "status": "error", "error": str(e)}
+    if compressed_path is None:
+        return {"path": path, "status": "unchanged"}
+    return {"path": path, "status": "built", "output": compressed_path}
+
+
+class BuildRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            try:
+                request = parse_request(line)
+            except ValueError as e:
+                self.send({"status": "error", "error": f"bad request: {e}"})
+                self.send({"done": True})
+                continue
+            if request.get("shutdown"):
+                self.send({"done": True})
+                # shutdown() waits for serve_forever() to return, so it has
+                # to be called from a thread other than this handler's.
+                threading.Thread(target=self.server.shutdown).start()
+                return
+            self.build(request["paths"])
+            self.send({"done": True})
+
+    def build(self, paths):
+        from concurrent.futures import as_completed
+        from concurrent.futures.process import BrokenProcessPool
+
+        executor = self.server.executor
+        broken = False
+        futures = {}
+        for path in paths:
+            try:
+                futures[executor.submit(build_page, path, self.server.public_dir)] = path
+            except Exception as e:
+                broken = broken or isinstance(e, BrokenProcessPool)
+                self.send(error_status(path, e))
+        for future in as_completed(futures):
+            try:
+                status = future.result()
+            except Exception as e:
+                broken = broken or isinstance(e, BrokenProcessPool)
+                status = error_status(futures[future], e)
+            self.send(status)
+
+        if broken:
+            self.server.replace_executor(executor)
+
+    def send(self, message):
+        self.wfile.write(json.dumps(message).encode() + b"\n")
+        self.wfile.flush()
+
+
+def parse_request(line):
+    # json.JSONDecodeError and UnicodeDecodeError are both ValueErrors.
+    request = json.loads(line)
+    if not isinstance(request, dict):
+        raise ValueError("expected a JSON object")
+    if request.get("shutdown"):
+        return request
+    if "paths" not in request:
+        raise ValueError("missing 'paths'")
+    paths = request["paths"]
+    if not isinstance(paths, list) or not all(isinstance(path, str) for path in paths):
+        raise ValueError("'paths' must be a list of strings")
+    return request
+
+
+def error_status(path, error):
+    return {"path": path, "status": "error", "error": f"{type(error).__name__}: {error}"}
+
+
+class RenderDaemon(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path=DEFAULT_SOCKET_PATH, max_workers=None, public_dir=DEFAULT_PUBLIC_DIR):
+        remove_stale_socket(socket_path)
+        super().__init__(socket_path, BuildRequestHandler)
+        self.socket_path = socket_path
+        self.public_dir = public_dir
+        self.max_workers = max_workers
+        self.executor_lock = threading.Lock()
+        self.executor = self.new_executor()
+
+    def new_executor(self):
+        from concurrent.futures import ProcessPoolExecutor
+
+        return ProcessPoolExecutor(max_workers=self.max_workers, initializer=warm_worker)
+
+    def replace_executor(self, broken_executor):
+        # Several handlers can notice the same broken pool; only the first
+        # one to get here replaces it.
+        with self.executor_lock:
+            if self.executor is not broken_executor:
+                return
+            self.executor = self.new_executor()
+        broken_executor.shutdown(wait=False)
+
+    def server_close(self):
+        super().server_close()
+        self.executor.shutdown()
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+
+
+def remove_stale_socket(socket_path):
+    if not os.path.exists(socket_path):
+        return
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(socket_path)
+    except ConnectionRefusedError:
+        os.remove(socket_path)
+    else:
+        raise RuntimeError(f"A render daemon is already listening on {socket_path}.")
+
+
+def serve(socket_path=DEFAULT_SOCKET_PATH, max_workers=None, public_dir=DEFAULT_PUBLIC_DIR):
+    with RenderDaemon(socket_path, max_workers, public_dir) as server:
+        server.serve_forever()
+
+
+def send_request(request, socket_path=DEFAULT_SOCKET_PATH):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        with sock.makefile("rwb") as stream:
+            stream.write(json.dumps(request).encode() + b"\n")
+            stream.flush()
+            for line in stream:
+                message = json.loads(line)
+                if message.get("done"):
+                    return
+                yield message
+    # Without the done marker we cannot tell a finished build from a daemon
+    # that died partway through one.
+    raise ConnectionError("The render daemon closed the connection before finishing.")
+
+
+def request_build(paths, socket_path=DEFAULT_SOCKET_PATH):
+    yield from send_request({"paths": list(paths)}, socket_path)
+
+
+def request_shutdown(socket_path=DEFAULT_SOCKET_PATH):
+    for _message in send_request({"shutdown": True}, socket_path):
+        pass
@@ -0,0 +1,273 @@
+import random
+import sys
+import time
+
+from converters import split_nodes_delimiter
+from converters import text_node_to_html_node
+from htmlnode import LeafNode
+from htmlnode import ParentNode
+from textnode import TextNode
+from textnode import TextType
+
+DEFAULT_CASES = 500
+DEFAULT_SEED = 0
+
+# "\r" and "\f" are HTML whitespace that minify collapses; "\xa0" is not and
+# must survive it.
+WORDS = ["alpha", "beta", "gamma", "delta", "x", "", "a b", " ", "\n", "  \t ", "\r\n", "\f", "\xa0", "a\xa0\xa0b"]
+DELIMITERS = ["**", "_", "`"]
+TAGS = ["div", "p", "h1", "ul", "li", "section", "pre", "span", "b", "i", "a", "code"]
+LEAF_TAGS = [None, None, "b", "i", "code", "span", "a", "pre", "p"]
+PROPS = [None, {}, {"class": "c"}, {"href": "https://www.boot.dev", "title": "two  spaces"}]
+
+
+# Generators. Each takes a random.Random so a corpus is reproducible from its seed.
+
+def random_text(rng, delimiters=DELIMITERS, max_words=6):
+    parts = []
+    for _ in range(rng.randint(0, max_words)):
+        parts.append(rng.choice(WORDS))
+        if rng.random() < 0.4:
+            parts.append(rng.choice(delimiters))
+    return " ".join(parts)
+
+
+def random_text_node(rng):
+    text_type = rng.choice(list(TextType))
+    url = "https://www.boot.dev" if text_type in (TextType.LINK, TextType.IMAGE) else None
+    return TextNode(random_text(rng), text_type, url)
+
+
+def random_markdown(rng, max_nodes=4):
+    """Return a (nodes, delimiter, text_type) case for split_nodes_delimiter."""
+    nodes = [random_text_node(rng) for _ in range(rng.randint(0, max_nodes))]
+    return nodes, rng.choice(DELIMITERS), rng.choice(list(TextType))
+
+
+def random_leaf(rng):
+    # A missing value is rare but kept so error paths are compared too.
+    value = None if rng.random() < 0.02 else random_text(rng, max_words=3)
+    return LeafNode(rng.choice(LEAF_TAGS), value, rng.choice(PROPS))
+
+
+def random_html_tree(rng, max_depth=4, max_children=4):
+    if max_depth == 0 or rng.random() < 0.3:
+        return random_leaf(rng)
+    children = [random_html_tree(rng, max_depth - 1, max_children) for _ in range(rng.randint(0, max_children))]
+    # As with leaf values, a missing tag or children list is rare but kept
+    # so ParentNode's error paths are compared too.
+    tag = None if rng.random() < 0.02 else rng.choice(TAGS)
+    if rng.random() < 0.02:
+        children = None
+    return ParentNode(tag, children, rng.choice(PROPS))
+
+
+# Shrinkers. Each yields strictly smaller variants of a case.
+
+def shorter_strings(text):
+    if text:
+        yield ""
+    if len(text) > 1:
+        yield text[: len(text) // 2]
+        yield text[len(text) // 2 :]
+        for i in range(len(text)):
+            yield text[:i] + text[i + 1 :]
+
+
+def shrink_html_tree(node):
+    if isinstance(node, ParentNode):
+        children = node.children or []
+        for child in children:
+            yield child
+        for i in range(len(children)):
+            yield ParentNode(node.tag, children[:i] + children[i + 1 :], node.props)
+        for i, child in enumerate(children):
+            for smaller in shrink_html_tree(child):
+                yield ParentNode(node.tag, children[:i] + [smaller] + children[i + 1 :], node.props)
+        if node.props:
+            yield ParentNode(node.tag, children, None)
+        return
+
+    if node.props:
+        yield LeafNode(node.tag, node.value, None)
+    if node.tag is not None:
+        yield LeafNode(None, node.value, node.props)
+    if node.value is not None:
+        for value in shorter_strings(node.value):
+            yield LeafNode(node.tag, value, node.props)
+
+
+def shrink_text_node(node):
+    for text in shorter_strings(node.text):
+        yield TextNode(text, node.text_type, node.url)
+    if node.text_type != TextType.TEXT:
+        yield TextNode(node.text, TextType.TEXT, node.url)
+
+
+def shrink_markdown(case):
+    nodes, delimiter, text_type = case
+    for i in range(len(nodes)):
+        yield nodes[:i] + nodes[i + 1 :], delimiter, text_type
+    for i, node in enumerate(nodes):
+        for smaller in shrink_text_node(node):
+            yield nodes[:i] + [smaller] + nodes[i + 1 :], delimiter, text_type
+
+
+def shrink(case, still_fails, shrinker, max_steps=10000):
+    """Greedily replace case with smaller variants for as long as they still fail."""
+    steps = 0
+    improved = True
+    while improved:
+        improved = False
+        for smaller in shrinker(case):
+            if steps >= max_steps:
+                return case
+            steps += 1
+            if still_fails(smaller):
+                case = smaller
+                improved = True
+                break
+    return case
+
+
+# Differential runner.
+
+def outcome(engine, case):
+    """Run engine on case, treating a raised exception as part of its output."""
+    try:
+        return ("ok", engine(case))
+    except Exception as e:
+        return ("error", type(e).__name__, str(e))
+
+
+def throughput(engine, corpus):
+    start = time.perf_counter()
+    for case in corpus:
+        outcome(engine, case)
+    elapsed = time.perf_counter() - start
+    return len(corpus) / elapsed if elapsed > 0 else float("inf")
+
+
+class Mismatch:
+    def __init__(self, case, minimal_case, expected, actual):
+        self.case = case
+        self.minimal_case = minimal_case
+        self.expected = expected
+        self.actual = actual
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.minimal_case!r}, expected={self.expected!r}, actual={self.actual!r})"
+
+
+class Report:
+    def __init__(self, name, cases, mismatch, throughput):
+        self.name = name
+        self.cases = cases
+        self.mismatch = mismatch
+        self.throughput = throughput
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.name!r}, {self.cases!r}, {self.mismatch!r}, {self.throughput!r})"
+
+
+def differential(name, reference, candidate, generate, shrinker, cases=DEFAULT_CASES, seed=DEFAULT_SEED):
+    """Check candidate against reference on a generated corpus.
+
+    Stops at the first case whose outcomes differ and shrinks it to a minimal
+    one. The throughput of both engines (cases per second) is measured on the
+    same corpus, so a fast path is only reported fast once it is also correct.
+    """
+    rng = random.Random(seed)
+    corpus = [generate(rng) for _ in range(cases)]
+
+    def differs(case):
+        return outcome(reference, case) != outcome(candidate, case)
+
+    mismatch = None
+    for case in corpus:
+        if differs(case):
+            minimal = shrink(case, differs, shrinker)
+            mismatch = Mismatch(case, minimal, outcome(reference, minimal), outcome(candidate, minimal))
+            break
+
+    rates = {
+        "reference": throughput(reference, corpus),
+        "candidate": throughput(candidate, corpus),
+    }
+    return Report(name, cases, mismatch, rates)
+
+
+# Reference engines and the fast paths checked against them. A new fast path
+# is registered by adding (name, candidate) to the CANDIDATES entry for the
+# reference it replaces.
+
+def render(node):
+    return node.to_html()
+
+
+def render_minified(node):
+    return node.to_html(minify=True)
+
+
+def split_markdown(case):
+    return split_nodes_delimiter(*case)
+
+
+def iterative_render(node):
+    """Render a tree with an explicit stack instead of recursing through to_html."""
+    out = []
+    stack = [node]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            out.append(item)
+        elif isinstance(item, ParentNode):
+            if item.tag is None:
+                raise ValueError("ParentNode object must have tag.")
+            if item.children is None:
+                raise ValueError("ParentNode object must have children nodes.")
+            stack.append(f"</{item.tag}>")
+            stack.extend(reversed(item.children))
+            stack.append(f"<{item.tag}{item.props_to_html()}>")
+        else:
+            out.append(item.to_html())
+    return "".join(out)
+
+
+REFERENCES = {
+    "split_nodes_delimiter": (split_markdown, random_markdown, shrink_markdown),
+    "text_node_to_html_node": (text_node_to_html_node, random_text_node, shrink_text_node),
+    "to_html": (render, random_html_tree, shrink_html_tree),
+    "to_html_minify": (render_minified, random_html_tree, shrink_html_tree),
+}
+
+CANDIDATES = {name: [] for name in REFERENCES}
+CANDIDATES["to_html"].append(("iterative", iterative_render))
+
+
+def run_all(cases=DEFAULT_CASES, seed=DEFAULT_SEED):
+    reports = []
+    for name, (reference, generate, shrinker) in REFERENCES.items():
+        for candidate_name, candidate in CANDIDATES[name]:
+            reports.append(differential(f"{name}/{candidate_name}", reference, candidate, generate, shrinker, cases, seed))
+    return reports
+
+
+def main():
+    failed = False
+    reports = run_all()
+    if not reports:
+        print("No candidate engines registered.")
+    for report in reports:
+        rates = ", ".join(f"{engine} {rate:,.0f} cases/s" for engine, rate in report.throughput.items())
+        print(f"{report.name}: {report.cases} cases, {rates}")
+        if report.mismatch is not None:
+            print(f"  mismatch on {report.mismatch.minimal_case!r}")
+            print(f"    reference: {report.mismatch.expected!r}")
+            print(f"    candidate: {report.mismatch.actual!r}")
+            failed = True
+    if failed:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
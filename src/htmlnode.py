@@ -1,3 +1,36 @@
+BLOCK_TAGS = frozenset({
+    "address", "article", "aside", "blockquote", "body", "dd", "details", "div",
+    "dl", "dt", "fieldset", "figcaption", "figure", "footer", "form", "h1", "h2",
+    "h3", "h4", "h5", "h6", "head", "header", "hr", "html", "li", "link", "main",
+    "meta", "nav", "ol", "p", "pre", "section", "table", "tbody", "td", "tfoot",
+    "th", "thead", "title", "tr", "ul",
+})
+# Whitespace inside these tags is significant and is never minified.
+PRESERVE_WHITESPACE_TAGS = frozenset({"pre", "textarea", "script", "style"})
+# HTML only treats ASCII whitespace as collapsible; a non-breaking space is
+# content and must survive minification.
+HTML_WHITESPACE = " \t\n\r\f"
+
+_whitespace_run = None
+
+
+def _collapse_whitespace(value):
+    # The regex module and pattern are only loaded the first time we minify.
+    global _whitespace_run
+    if _whitespace_run is None:
+        import re
+        _whitespace_run = re.compile(f"[{HTML_WHITESPACE}]+")
+    return _whitespace_run.sub(" ", value)
+
+
+def _is_block(node):
+    return node.tag in BLOCK_TAGS
+
+
+def _is_text(node):
+    return isinstance(node, LeafNode) and node.tag is None
+
+
 class HTMLNode:
     def __init__(self, tag = None, value = None, children = None, props = None):
         self.tag = tag
@@ -5,7 +38,7 @@ class HTMLNode:
         self.children = children
         self.props = props
 
-    def to_html(self):
+    def to_html(self, minify=False):
         raise NotImplementedError
     
     def props_to_html(self):
@@ -22,13 +55,16 @@ class LeafNode(HTMLNode):
     def __init__(self, tag=None, value=None, props=None):
         super().__init__(tag=tag, value=value, props=props)
 
-    def to_html(self):
+    def to_html(self, minify=False):
         if self.value == None:
             raise ValueError("A LeafNode must have a value.")
+        value = self.value
+        if minify and self.tag not in PRESERVE_WHITESPACE_TAGS:
+            value = _collapse_whitespace(value)
         if self.tag == None:
-            return self.value
+            return value
         else:
-            return f"<{self.tag}{self.props_to_html()}>{self.value}</{self.tag}>"
+            return f"<{self.tag}{self.props_to_html()}>{value}</{self.tag}>"
         
     def __eq__(self, other):
         if not isinstance(other, LeafNode):
@@ -43,29 +79,47 @@ class ParentNode(HTMLNode):
         super().__init__(tag=tag, children=children, props=props)
 
     
-    def to_html(self):
+    def to_html(self, minify=False):
         if self.tag is None:
             raise ValueError("ParentNode object must have tag.")
         if self.children is None:
             raise ValueError("ParentNode object must have children nodes.")
         
         else:
-            html_strings = []
-            for child in self.children:
-                html_strings.append(child.to_html())
+            if minify and self.tag in PRESERVE_WHITESPACE_TAGS:
+                minify = False
+
+            if not minify:
+                html_strings = [child.to_html() for child in self.children]
+            else:
+                html_strings = self._minified_children_html()
 
             children_html = "".join(html_strings)
 
             return f"<{self.tag}{self.props_to_html()}>{children_html}</{self.tag}>"
-        
-        
-        
-
-
-        
-
-        
-
 
+    def _minified_children_html(self):
+        # Adjacent text children (split_nodes_delimiter produces runs of them)
+        # render as one stretch of text, so they are minified as one run.
+        html_strings = []
+        children = self.children
+        i = 0
+        while i < len(children):
+            if not _is_text(children[i]):
+                html_strings.append(children[i].to_html(minify=True))
+                i += 1
+                continue
 
+            j = i
+            while j < len(children) and _is_text(children[j]):
+                j += 1
+            text = "".join(child.to_html() for child in children[i:j])
 
+            # Whitespace with a block element (or the edge of a block
+            # container) on both sides never renders, so drop it.
+            before_is_block = _is_block(children[i - 1]) if i > 0 else _is_block(self)
+            after_is_block = _is_block(children[j]) if j < len(children) else _is_block(self)
+            if not (text.strip(HTML_WHITESPACE) == "" and before_is_block and after_is_block):
+                html_strings.append(_collapse_whitespace(text))
+            i = j
+        return html_strings
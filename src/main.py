@@ -1,10 +1,78 @@
-from textnode import TextType
-from textnode import TextNode
+# Imports live inside the functions below so that loading this module stays
+# cheap; the CLI runs on every save in watch mode and in pre-commit hooks.
+import sys
+
+PUBLIC_DIR = "public"
+
+USAGE = """usage: main.py                 render the demo node and precompress public/
+       main.py serve           run the render daemon on .render.sock
+       main.py build PATH...   build PATHs through the daemon, or locally if none is running
+       main.py stop            stop the render daemon"""
 
 def main():
+    from textnode import TextType
+    from textnode import TextNode
+    from compress import precompress_directory
+
     test_textnode = TextNode("This is some anchor text", TextType.LINK, "https://www.boot.dev")
     print (test_textnode)
 
-if __name__ == "__main__":
-    main()
+    for path in precompress_directory(PUBLIC_DIR):
+        print(f"Compressed {path}")
+
+def build(paths):
+    from daemon import build_page
+    from daemon import request_build
+
+    failed = False
+    try:
+        # Statuses stream back from the daemon as each page finishes.
+        for status in request_build(paths):
+            failed = report(status) or failed
+    except (FileNotFoundError, ConnectionRefusedError):
+        # No daemon running: build in this process instead.
+        for path in paths:
+            failed = report(build_page(path)) or failed
+    except ConnectionError as e:
+        print(e, file=sys.stderr)
+        return 1
+    return 1 if failed else 0
+
+def stop():
+    from daemon import request_shutdown
 
+    try:
+        request_shutdown()
+    except (FileNotFoundError, ConnectionRefusedError):
+        print("no render daemon running", file=sys.stderr)
+        return 1
+    return 0
+
+def report(status):
+    # Errors about the request as a whole carry no path.
+    print(f"{status['status']}: {status.get('path', '(request)')}", flush=True)
+    if status["status"] == "error":
+        print(f"  {status['error']}", flush=True)
+        return True
+    return False
+
+def run(args):
+    if not args:
+        main()
+        return 0
+
+    command, rest = args[0], args[1:]
+    if command == "serve" and not rest:
+        from daemon import serve
+        serve()
+        return 0
+    if command == "stop" and not rest:
+        return stop()
+    if command == "build" and rest:
+        return build(rest)
+
+    print(USAGE, file=sys.stderr)
+    return 2
+
+if __name__ == "__main__":
+    sys.exit(run(sys.argv[1:]))
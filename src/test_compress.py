@@ -0,0 +1,87 @@
+import gzip
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from compress import find_compressible_files
+from compress import precompress_directory
+from compress import precompress_file
+
+
+class TestPrecompress(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = self.tmp.name
+        self.html_path = os.path.join(self.dir, "index.html")
+        self.css_path = os.path.join(self.dir, "styles.css")
+        with open(self.html_path, "w") as f:
+            f.write("<html><body><h1>Hello</h1></body></html>")
+        with open(self.css_path, "w") as f:
+            f.write("body { margin: 0 auto; }")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_writes_gz_sibling(self):
+        """Test that a .gz sibling is written and round-trips to the source."""
+        self.assertEqual(precompress_file(self.html_path), f"{self.html_path}.gz")
+        with gzip.open(f"{self.html_path}.gz", "rb") as f:
+            self.assertEqual(f.read(), b"<html><body><h1>Hello</h1></body></html>")
+
+    def test_output_is_reproducible(self):
+        """Test that compressing the same file twice produces identical bytes."""
+        precompress_file(self.html_path)
+        with open(f"{self.html_path}.gz", "rb") as f:
+            first = f.read()
+        os.remove(f"{self.html_path}.gz")
+        precompress_file(self.html_path)
+        with open(f"{self.html_path}.gz", "rb") as f:
+            self.assertEqual(f.read(), first)
+
+    def test_skips_unchanged_file(self):
+        """Test that an up-to-date .gz sibling is not rewritten."""
+        precompress_file(self.html_path)
+        self.assertIsNone(precompress_file(self.html_path))
+
+    def test_recompresses_changed_file(self):
+        """Test that a source newer than its .gz sibling is recompressed."""
+        precompress_file(self.html_path)
+        gz_mtime = os.path.getmtime(f"{self.html_path}.gz")
+        os.utime(self.html_path, (gz_mtime + 10, gz_mtime + 10))
+        self.assertEqual(precompress_file(self.html_path), f"{self.html_path}.gz")
+
+    def test_failed_write_leaves_no_temp_file(self):
+        """Test that a failed write removes its temp file and publishes nothing."""
+        with mock.patch("compress.os.replace", side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                precompress_file(self.html_path)
+        self.assertEqual(sorted(os.listdir(self.dir)), ["index.html", "styles.css"])
+
+    def test_gz_is_world_readable(self):
+        """Test that the .gz of a world-readable page can be read by a static server."""
+        os.chmod(self.html_path, 0o644)
+        precompress_file(self.html_path)
+        self.assertEqual(os.stat(f"{self.html_path}.gz").st_mode & 0o777, 0o644)
+
+    def test_gz_keeps_private_source_private(self):
+        """Test that the .gz of an owner-only page is owner-only too."""
+        os.chmod(self.html_path, 0o600)
+        precompress_file(self.html_path)
+        self.assertEqual(os.stat(f"{self.html_path}.gz").st_mode & 0o777, 0o600)
+
+    def test_finds_only_html_and_css(self):
+        """Test that only HTML and CSS files are picked up."""
+        with open(os.path.join(self.dir, "image.png"), "wb") as f:
+            f.write(b"\x89PNG")
+        self.assertEqual(find_compressible_files(self.dir), [self.html_path, self.css_path])
+
+    def test_precompress_directory(self):
+        """Test compressing a directory in a process pool, then skipping on rerun."""
+        written = precompress_directory(self.dir, max_workers=2)
+        self.assertEqual(sorted(written), sorted([f"{self.html_path}.gz", f"{self.css_path}.gz"]))
+        self.assertEqual(precompress_directory(self.dir, max_workers=2), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,218 @@
+import json
+import os
+import signal
+import socket
+import tempfile
+import threading
+import time
+import unittest
+from contextlib import redirect_stderr
+from io import StringIO
+
+from daemon import RenderDaemon
+from daemon import build_page
+from daemon import request_build
+from daemon import request_shutdown
+from daemon import send_request
+from main import run
+
+
+class TestBuildPage(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.page = os.path.join(self.tmp.name, "index.html")
+        with open(self.page, "w") as f:
+            f.write("<html><body><h1>Hello</h1></body></html>")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_builds_then_reports_unchanged(self):
+        """Test that a page is built once and then reported unchanged."""
+        self.assertEqual(build_page(self.page, self.tmp.name), {"path": self.page, "status": "built", "output": f"{self.page}.gz"})
+        self.assertEqual(build_page(self.page, self.tmp.name), {"path": self.page, "status": "unchanged"})
+
+    def test_missing_page_reports_error(self):
+        """Test that a missing page is reported as an error instead of raising."""
+        missing = os.path.join(self.tmp.name, "missing.html")
+        status = build_page(missing, self.tmp.name)
+        self.assertEqual(status["status"], "error")
+        self.assertEqual(status["path"], missing)
+
+    def test_rejects_non_page_file(self):
+        """Test that files other than HTML and CSS are never compressed."""
+        key = os.path.join(self.tmp.name, "id_rsa")
+        with open(key, "w") as f:
+            f.write("secret")
+        self.assertEqual(build_page(key, self.tmp.name)["status"], "error")
+        self.assertFalse(os.path.exists(f"{key}.gz"))
+
+    def test_rejects_page_outside_public_dir(self):
+        """Test that pages outside the public dir are never compressed."""
+        public_dir = os.path.join(self.tmp.name, "public")
+        os.mkdir(public_dir)
+        for path in (self.page, os.path.join(public_dir, "..", "index.html")):
+            self.assertEqual(build_page(path, public_dir)["status"], "error")
+        self.assertFalse(os.path.exists(f"{self.page}.gz"))
+
+    def test_rejects_symlink_out_of_public_dir(self):
+        """Test that a link inside the public dir cannot point the build elsewhere."""
+        public_dir = os.path.join(self.tmp.name, "public")
+        os.mkdir(public_dir)
+        link = os.path.join(public_dir, "link.html")
+        os.symlink(self.page, link)
+        self.assertEqual(build_page(link, public_dir)["status"], "error")
+
+
+class TestRenderDaemon(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.socket_path = os.path.join(self.tmp.name, "render.sock")
+        self.pages = []
+        for i in range(3):
+            page = os.path.join(self.tmp.name, f"page_{i}.html")
+            with open(page, "w") as f:
+                f.write(f"<html><body><h1>Page {i}</h1></body></html>")
+            self.pages.append(page)
+
+        self.server = RenderDaemon(self.socket_path, max_workers=2, public_dir=self.tmp.name)
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.start()
+
+    def tearDown(self):
+        if self.thread.is_alive():
+            request_shutdown(self.socket_path)
+            self.thread.join()
+        self.server.server_close()
+        self.tmp.cleanup()
+
+    def test_streams_status_per_page(self):
+        """Test that the daemon reports one status per requested page."""
+        statuses = list(request_build(self.pages, self.socket_path))
+        self.assertEqual(sorted(s["path"] for s in statuses), self.pages)
+        self.assertTrue(all(s["status"] == "built" for s in statuses))
+        for page in self.pages:
+            self.assertTrue(os.path.exists(f"{page}.gz"))
+
+    def test_workers_stay_warm_between_requests(self):
+        """Test that a second request on the same daemon reuses its workers."""
+        list(request_build(self.pages, self.socket_path))
+        statuses = list(request_build(self.pages, self.socket_path))
+        self.assertTrue(all(s["status"] == "unchanged" for s in statuses))
+
+    def exchange(self, line):
+        """Send raw request lines and return every reply up to the last done."""
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(self.socket_path)
+            with sock.makefile("rwb") as stream:
+                stream.write(line)
+                stream.flush()
+                replies = []
+                pending = line.count(b"\n")
+                for reply in stream:
+                    replies.append(json.loads(reply))
+                    if replies[-1].get("done"):
+                        pending -= 1
+                        if pending == 0:
+                            return replies
+        self.fail(f"connection closed without done: {replies!r}")
+
+    def test_bad_requests_get_an_error_then_done(self):
+        """Test that malformed requests are answered instead of killing the handler."""
+        for line in (b"not json\n", b"[1, 2]\n", b"{}\n", b'{"paths": "abc"}\n', b'{"paths": [1]}\n'):
+            replies = self.exchange(line)
+            self.assertEqual(len(replies), 2, line)
+            self.assertEqual(replies[0]["status"], "error", line)
+            self.assertTrue(replies[0]["error"].startswith("bad request: "), line)
+            self.assertEqual(replies[1], {"done": True}, line)
+
+    def test_connection_survives_a_bad_request(self):
+        """Test that a good request on the same connection still builds after a bad one."""
+        request = json.dumps({"paths": self.pages[:1]}).encode()
+        replies = self.exchange(b"not json\n" + request + b"\n")
+        self.assertEqual(replies[0]["status"], "error")
+        self.assertEqual(replies[1:], [
+            {"done": True},
+            {"path": self.pages[0], "status": "built", "output": f"{self.pages[0]}.gz"},
+            {"done": True},
+        ])
+
+    def test_killed_worker_reports_errors_and_recovers(self):
+        """Test that a dead worker turns into error statuses and a fresh pool."""
+        list(request_build(self.pages[:1], self.socket_path))
+        broken_executor = self.server.executor
+        # Killing one worker breaks the whole pool, which then terminates the
+        # others itself.
+        process = next(iter(broken_executor._processes.values()))
+        os.kill(process.pid, signal.SIGKILL)
+        process.join()
+        # Wait for the pool to notice, so no page can still finish on a
+        # surviving worker.
+        deadline = time.monotonic() + 10
+        while not broken_executor._broken and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        statuses = list(request_build(self.pages, self.socket_path))
+        self.assertEqual(sorted(s["path"] for s in statuses), self.pages)
+        self.assertTrue(all(s["status"] == "error" for s in statuses))
+        self.assertIn("BrokenProcessPool", statuses[0]["error"])
+
+        self.assertIsNot(self.server.executor, broken_executor)
+        statuses = list(request_build(self.pages[1:], self.socket_path))
+        self.assertTrue(all(s["status"] == "built" for s in statuses))
+
+    def test_shutdown_removes_socket(self):
+        """Test that a shutdown request stops the daemon and removes its socket."""
+        request_shutdown(self.socket_path)
+        self.thread.join()
+        self.server.server_close()
+        self.assertFalse(os.path.exists(self.socket_path))
+
+    def test_refuses_to_start_over_a_live_daemon(self):
+        """Test that a second daemon will not take over a socket in use."""
+        with self.assertRaisesRegex(RuntimeError, "already listening"):
+            RenderDaemon(self.socket_path, max_workers=1)
+
+
+class TestSendRequest(unittest.TestCase):
+    def test_connection_closed_before_done_raises(self):
+        """Test that a stream ending without the done marker is an error."""
+        with tempfile.TemporaryDirectory() as tmp:
+            socket_path = os.path.join(tmp, "render.sock")
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+                server.bind(socket_path)
+                server.listen()
+                errors = []
+
+                def consume():
+                    try:
+                        list(send_request({"paths": ["index.html"]}, socket_path))
+                    except ConnectionError as e:
+                        errors.append(e)
+
+                client_thread = threading.Thread(target=consume)
+                client_thread.start()
+                conn, _address = server.accept()
+                with conn:
+                    conn.recv(1024)
+                client_thread.join()
+        self.assertEqual(len(errors), 1)
+
+
+class TestStopCommand(unittest.TestCase):
+    def test_stop_without_daemon_fails_cleanly(self):
+        """Test that main.py stop with no daemon reports it and exits non-zero."""
+        with tempfile.TemporaryDirectory() as tmp:
+            cwd = os.getcwd()
+            os.chdir(tmp)
+            try:
+                stderr = StringIO()
+                with redirect_stderr(stderr):
+                    self.assertEqual(run(["stop"]), 1)
+            finally:
+                os.chdir(cwd)
+        self.assertEqual(stderr.getvalue(), "no render daemon running\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+import random
+import unittest
+
+from fuzz import CANDIDATES
+from fuzz import differential
+from fuzz import iterative_render
+from fuzz import outcome
+from fuzz import random_html_tree
+from fuzz import random_markdown
+from fuzz import render
+from fuzz import render_minified
+from fuzz import run_all
+from fuzz import shorter_strings
+from fuzz import shrink
+from fuzz import shrink_html_tree
+from fuzz import shrink_markdown
+from fuzz import split_markdown
+from htmlnode import LeafNode
+from htmlnode import ParentNode
+
+
+class TestShrink(unittest.TestCase):
+    def test_shrinks_string_to_minimal_failure(self):
+        """Test that shrinking keeps only what is needed to fail."""
+        self.assertEqual(shrink("hello world", lambda s: "o" in s, shorter_strings), "o")
+
+    def test_max_steps_bounds_the_number_of_checks(self):
+        """Test that shrinking stops after max_steps candidate checks."""
+        checks = []
+
+        def still_fails(text):
+            checks.append(text)
+            return False
+
+        self.assertEqual(shrink("x" * 100, still_fails, shorter_strings, max_steps=5), "x" * 100)
+        self.assertEqual(len(checks), 5)
+
+    def test_shrinks_tree_to_single_leaf(self):
+        """Test that a failing subtree is hoisted out of its parents."""
+        tree = ParentNode("div", [
+            LeafNode("p", "keep"),
+            ParentNode("ul", [LeafNode("li", "x"), LeafNode("b", "boom", {"class": "c"})]),
+        ])
+        minimal = shrink(tree, lambda node: "m" in outcome(render, node)[1], shrink_html_tree)
+        self.assertEqual(minimal, LeafNode(None, "m"))
+
+
+class TestOutcome(unittest.TestCase):
+    def test_exceptions_are_part_of_the_outcome(self):
+        """Test that errors compare by type and message."""
+        self.assertEqual(outcome(render, LeafNode("p", None)), ("error", "ValueError", "A LeafNode must have a value."))
+        self.assertEqual(outcome(render, LeafNode("p", "hi")), ("ok", "<p>hi</p>"))
+
+
+class TestDifferential(unittest.TestCase):
+    def test_corpus_is_reproducible_from_seed(self):
+        """Test that the same seed generates the same trees."""
+        first = [repr(random_html_tree(random.Random(7))) for _ in range(5)]
+        second = [repr(random_html_tree(random.Random(7))) for _ in range(5)]
+        self.assertEqual(first, second)
+
+    def test_corpus_covers_parent_node_errors(self):
+        """Test that generated trees reach both ParentNode ValueError branches."""
+        rng = random.Random(0)
+        errors = {outcome(render, random_html_tree(rng))[-1] for _ in range(500)}
+        self.assertIn("ParentNode object must have tag.", errors)
+        self.assertIn("ParentNode object must have children nodes.", errors)
+
+    def test_renderer_without_checks_is_caught(self):
+        """Test that a renderer that skips ParentNode's checks mismatches."""
+        def unchecked_render(node):
+            if isinstance(node, ParentNode):
+                children_html = "".join(unchecked_render(child) for child in node.children or [])
+                return f"<{node.tag}{node.props_to_html()}>{children_html}</{node.tag}>"
+            return node.to_html()
+
+        report = differential("to_html/unchecked", render, unchecked_render, random_html_tree, shrink_html_tree)
+        self.assertIsNotNone(report.mismatch)
+        self.assertEqual(report.mismatch.expected[0], "error")
+
+    def test_equivalent_engine_has_no_mismatch(self):
+        """Test that an iterative renderer matches ParentNode.to_html."""
+        report = differential("to_html/iterative", render, iterative_render, random_html_tree, shrink_html_tree, cases=300)
+        self.assertIsNone(report.mismatch)
+        self.assertEqual(report.cases, 300)
+        self.assertEqual(set(report.throughput), {"reference", "candidate"})
+        self.assertTrue(all(rate > 0 for rate in report.throughput.values()))
+
+    def test_render_mismatch_is_shrunk(self):
+        """Test that a renderer that ignores minify is caught and shrunk."""
+        report = differential("to_html_minify/broken", render_minified, render, random_html_tree, shrink_html_tree)
+        self.assertIsNotNone(report.mismatch)
+        minimal = report.mismatch.minimal_case
+        self.assertEqual(minimal, LeafNode(None, minimal.value))
+        # A lone non-space whitespace character is the smallest text minify changes.
+        self.assertIn(minimal.value, ["\n", "\t", "\r", "\f"])
+
+    def test_markdown_mismatch_is_shrunk(self):
+        """Test that a splitter that drops empty nodes is shrunk to one empty node."""
+        def drop_empty(case):
+            return [node for node in split_markdown(case) if node.text]
+
+        report = differential("split_nodes_delimiter/broken", split_markdown, drop_empty, random_markdown, shrink_markdown)
+        self.assertIsNotNone(report.mismatch)
+        nodes, _delimiter, _text_type = report.mismatch.minimal_case
+        self.assertEqual(len(nodes), 1)
+        self.assertEqual(nodes[0].text, "")
+
+    def test_registered_candidates_match_their_references(self):
+        """Test that every shipped fast path agrees with its reference."""
+        self.assertIn(("iterative", iterative_render), CANDIDATES["to_html"])
+        reports = run_all(cases=200)
+        self.assertEqual([report.name for report in reports], ["to_html/iterative"])
+        self.assertTrue(all(report.mismatch is None for report in reports))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -282,5 +282,63 @@ class TestParentNode(unittest.TestCase):
             "<div><span><b>grandchild</b></span></div>",
         )
 
+class TestMinify(unittest.TestCase):
+    def test_default_render_is_unchanged(self):
+        """Test that whitespace is kept verbatim when minify is off."""
+        node = ParentNode("div", [LeafNode(None, "\n  "), LeafNode("p", "a  b"), LeafNode(None, "\n")])
+        self.assertEqual(node.to_html(), "<div>\n  <p>a  b</p>\n</div>")
+
+    def test_drops_whitespace_between_block_elements(self):
+        """Test that whitespace-only text between block elements is dropped."""
+        node = ParentNode("div", [
+            LeafNode(None, "\n  "),
+            LeafNode("h1", "Title"),
+            LeafNode(None, "\n\n  "),
+            LeafNode("p", "Body"),
+            LeafNode(None, "\n"),
+        ])
+        self.assertEqual(node.to_html(minify=True), "<div><h1>Title</h1><p>Body</p></div>")
+
+    def test_keeps_whitespace_between_inline_elements(self):
+        """Test that whitespace between inline elements collapses to one space."""
+        node = ParentNode("p", [LeafNode("b", "bold"), LeafNode(None, "\n   "), LeafNode("i", "italic")])
+        self.assertEqual(node.to_html(minify=True), "<p><b>bold</b> <i>italic</i></p>")
+
+    def test_collapses_whitespace_inside_text(self):
+        """Test that runs of whitespace inside text collapse to a single space."""
+        node = ParentNode("p", [LeafNode(None, "Some \n\t text   with"), LeafNode("b", " spaced   words ")])
+        self.assertEqual(node.to_html(minify=True), "<p>Some text with<b> spaced words </b></p>")
+
+    def test_preserves_whitespace_in_pre(self):
+        """Test that whitespace inside <pre> is left untouched."""
+        node = ParentNode("div", [
+            LeafNode(None, "\n"),
+            ParentNode("pre", [LeafNode("code", "def f():\n    return 1\n")]),
+            LeafNode(None, "\n"),
+        ])
+        self.assertEqual(node.to_html(minify=True), "<div><pre><code>def f():\n    return 1\n</code></pre></div>")
+
+    def test_drops_run_of_blank_text_nodes_between_blocks(self):
+        """Test that adjacent whitespace-only text nodes are dropped together."""
+        node = ParentNode("div", [LeafNode(None, "\n"), LeafNode(None, "\n"), LeafNode("p", "x")])
+        self.assertEqual(node.to_html(minify=True), "<div><p>x</p></div>")
+
+    def test_collapses_whitespace_across_adjacent_text_nodes(self):
+        """Test that whitespace split across adjacent text nodes collapses to one space."""
+        node = ParentNode("p", [LeafNode(None, "a "), LeafNode(None, " b"), LeafNode("b", "c")])
+        self.assertEqual(node.to_html(minify=True), "<p>a b<b>c</b></p>")
+
+    def test_keeps_non_breaking_spaces(self):
+        """Test that non-breaking spaces are neither collapsed nor dropped."""
+        self.assertEqual(LeafNode(None, "a\xa0\xa0b").to_html(minify=True), "a\xa0\xa0b")
+        node = ParentNode("div", [LeafNode("p", "a"), LeafNode(None, "\xa0\xa0"), LeafNode("p", "b")])
+        self.assertEqual(node.to_html(minify=True), "<div><p>a</p>\xa0\xa0<p>b</p></div>")
+
+    def test_does_not_touch_attribute_values(self):
+        """Test that prop values are rendered verbatim when minifying."""
+        node = ParentNode("div", [LeafNode("a", "link", {"title": "two  spaces"})])
+        self.assertEqual(node.to_html(minify=True), '<div><a title="two  spaces">link</a></div>')
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
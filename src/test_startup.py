@@ -0,0 +1,57 @@
+import os
+import subprocess
+import sys
+import unittest
+
+from bench_startup import parse_importtime
+
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def loaded_modules_after(statement):
+    """Return the modules a fresh interpreter has loaded after running statement."""
+    result = subprocess.run(
+        [sys.executable, "-c", f"import sys; {statement}; print(' '.join(sys.modules))"],
+        cwd=SRC_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(result.stdout.split())
+
+
+class TestLazyImports(unittest.TestCase):
+    def test_importing_main_is_cheap(self):
+        """Test that importing the entry point loads no enum, regex or pool modules."""
+        modules = loaded_modules_after("import main")
+        for name in ("enum", "re", "gzip", "concurrent.futures", "textnode", "compress"):
+            self.assertNotIn(name, modules)
+
+    def test_htmlnode_defers_regex(self):
+        """Test that htmlnode only loads re once minification is used."""
+        self.assertNotIn("re", loaded_modules_after("import htmlnode"))
+        self.assertIn("re", loaded_modules_after(
+            "from htmlnode import LeafNode; LeafNode('p', 'a  b').to_html(minify=True)"
+        ))
+
+    def test_compress_defers_gzip_and_pool(self):
+        """Test that compress loads gzip and the process pool only on demand."""
+        modules = loaded_modules_after("import compress")
+        self.assertNotIn("gzip", modules)
+        self.assertNotIn("concurrent.futures", modules)
+
+
+class TestParseImporttime(unittest.TestCase):
+    def test_sums_top_level_cumulative_times(self):
+        """Test that only unindented imports count toward the total."""
+        stderr = (
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       100 |        100 |   _io\n"
+            "import time:       200 |        300 | io\n"
+            "import time:      1500 |       1500 | main\n"
+        )
+        self.assertEqual(parse_importtime(stderr), 1.8)
+
+
+if __name__ == "__main__":
+    unittest.main()